@@ -3,7 +3,7 @@
 Canvas TUI - A terminal interface for managing Canvas LMS tasks
 
 Installation:
-    pip install textual requests python-dateutil
+    pip install textual requests orjson
 
 Configuration:
     Create ~/.config/canvas-tui/config.json with:
@@ -22,15 +22,22 @@ Keybindings:
     q - Quit
 """
 
+import hashlib
 import json
 import os
+import sqlite3
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Set
+import orjson
 import requests
-from dateutil import parser as date_parser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from zoneinfo import ZoneInfo
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical, Horizontal
@@ -38,9 +45,68 @@ from textual.widgets import (
     Header, Footer, Static, DataTable, Input, Button, 
     TextArea, Select, Label
 )
+from textual.widgets.data_table import CellDoesNotExist
 from textual.binding import Binding
 from textual.screen import ModalScreen
-from textual import on
+from textual.worker import Worker, get_current_worker
+from textual import on, work
+
+
+# All task times are displayed in Manila local time
+MANILA = ZoneInfo('Asia/Manila')
+
+# (connect, read) timeouts in seconds for Canvas requests
+REQUEST_TIMEOUT = (3.05, 15)
+
+# Per-course statuses meaning "hidden from this user", not a failed fetch
+NO_ACCESS_STATUSES = {401, 403, 404}
+
+
+def _parse_canvas_dt(s: str) -> datetime:
+    """Parse a Canvas ISO-8601 timestamp (``Z`` suffix or plain date)"""
+    return datetime.fromisoformat(s.replace('Z', '+00:00'))
+
+
+def _to_manila_naive_if_in_window(iso_str: str, start_ts: float, end_ts: float) -> Optional[datetime]:
+    """Convert a Canvas timestamp to naive Manila time if it lies in the window
+    
+    The window is given as POSIX timestamps so the check is two float
+    compares. Returns None for timestamps outside it or that fail to parse.
+    """
+    try:
+        dt = _parse_canvas_dt(iso_str)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        # Offset-less values (e.g. all-day dates) are UTC
+        dt = dt.replace(tzinfo=timezone.utc)
+    if not start_ts <= dt.timestamp() <= end_ts:
+        return None
+    return dt.astimezone(MANILA).replace(tzinfo=None)
+
+
+def _cache_account(base_url: str, token: str) -> str:
+    """Identify a Canvas account for the task cache without storing the token"""
+    digest = hashlib.sha256(token.encode()).hexdigest()[:16]
+    return f"{base_url.rstrip('/')}#{digest}"
+
+
+@dataclass(slots=True)
+class Task:
+    """A normalized Canvas item shown in the task table"""
+    title: str
+    due_date: datetime  # naive, Manila time
+    course: str
+    type: str
+    url: Optional[str]
+    raw: Dict[str, Any]
+    # Canvas request the task came from, e.g. 'assignments:123'
+    source: str = ''
+
+
+def _task_key(task: Task) -> str:
+    """Stable table row key for a task: its type plus Canvas id"""
+    return f"{task.type}:{task.raw.get('id')}"
 
 
 # ============================================================================
@@ -58,93 +124,160 @@ class CanvasAPI:
             'Content-Type': 'application/json'
         }
         self.user_id = None
+        # Reuse one pooled, keep-alive connection set for every Canvas call,
+        # retrying idempotent GETs on throttling and transient server errors
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            respect_retry_after_header=True,
+        )
+        self.session.mount(
+            'https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        )
+        # Page URL -> (ETag, parsed body, next page URL)
+        self._etag_cache: Dict[str, Tuple[str, Any, Optional[str]]] = {}
+        # Page URLs requested since the last prune_etag_cache()
+        self._etag_used: Set[str] = set()
+    
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+    
+    def prune_etag_cache(self):
+        """Drop cached pages that were not requested since the last prune
+        
+        Calendar URLs embed a date window, so without this every day of a
+        long session would leave another full copy of each events page.
+        """
+        used = self._etag_used
+        self._etag_used = set()
+        self._etag_cache = {k: v for k, v in self._etag_cache.items() if k in used}
+    
+    def _cached_get(self, url: str, params: Optional[Dict[str, Any]]) -> Tuple[Any, Optional[str]]:
+        """GET one page, revalidating a cached copy with If-None-Match
+        
+        Returns the parsed body and the next page URL. Raises on HTTP errors.
+        """
+        # Key on the full URL so each course / query gets its own entry
+        key = requests.Request('GET', url, params=params).prepare().url
+        self._etag_used.add(key)
+        cached = self._etag_cache.get(key)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        
+        response = self.session.get(key, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304 and cached:
+            return cached[1], cached[2]
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        next_url = response.links.get('next', {}).get('url')
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etag_cache[key] = (etag, data, next_url)
+        return data, next_url
+    
+    def _get_all(self, url: str, params: Optional[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield items from every page of a Canvas list endpoint"""
+        while url:
+            data, url = self._cached_get(url, params)
+            yield from data
+            # The next link already carries the query string
+            params = None
     
     def validate_token(self) -> bool:
-        """Validate Canvas token by fetching user info"""
-        try:
-            response = requests.get(
-                f'{self.base_url}/api/v1/users/self',
-                headers=self.headers,
-                timeout=10
-            )
-            if response.status_code == 200:
-                user_data = response.json()
-                self.user_id = user_data.get('id')
-                return True
-            return False
-        except Exception as e:
-            print(f"Token validation failed: {e}")
+        """Validate Canvas token by fetching user info
+        
+        Returns False only when Canvas rejects the token. Raises
+        requests.RequestException when Canvas can't be reached or errors.
+        """
+        response = self.session.get(
+            f'{self.base_url}/api/v1/users/self',
+            timeout=REQUEST_TIMEOUT
+        )
+        if response.status_code in (401, 403):
             return False
+        response.raise_for_status()
+        user_data = orjson.loads(response.content)
+        self.user_id = user_data.get('id')
+        return True
     
-    def get_active_courses(self) -> List[Dict[str, Any]]:
-        """Fetch active courses for the user"""
+    def get_active_courses(self) -> Optional[List[Dict[str, Any]]]:
+        """Fetch active courses for the user, or None if the request failed"""
         try:
-            response = requests.get(
+            return list(self._get_all(
                 f'{self.base_url}/api/v1/courses',
-                headers=self.headers,
-                params={'enrollment_state': 'active', 'per_page': 50},
-                timeout=10
-            )
-            if response.status_code == 200:
-                return response.json()
-            return []
+                {'enrollment_state': 'active', 'per_page': 100}
+            ))
         except Exception as e:
             print(f"Failed to fetch courses: {e}")
-            return []
+            return None
     
-    def get_assignments(self, course_id: int) -> List[Dict[str, Any]]:
-        """Fetch assignments for a specific course"""
+    def get_assignments(self, course_id: int) -> Optional[List[Dict[str, Any]]]:
+        """Fetch assignments for a specific course, or None if the request failed
+        
+        Courses that hide assignments from the user yield an empty list.
+        """
         try:
-            response = requests.get(
+            return list(self._get_all(
                 f'{self.base_url}/api/v1/courses/{course_id}/assignments',
-                headers=self.headers,
-                params={'per_page': 50, 'order_by': 'due_at'},
-                timeout=10
-            )
-            if response.status_code == 200:
-                return response.json()
-            return []
+                # Let Canvas drop past-due assignments; only upcoming ones are shown
+                {'per_page': 100, 'order_by': 'due_at', 'bucket': 'future'}
+            ))
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code in NO_ACCESS_STATUSES:
+                # Restricted course or hidden assignments: nothing to show
+                return []
+            print(f"Failed to fetch assignments for course {course_id}: {e}")
+            return None
         except Exception as e:
             print(f"Failed to fetch assignments for course {course_id}: {e}")
-            return []
+            return None
     
-    def get_planner_notes(self) -> List[Dict[str, Any]]:
-        """Fetch user's planner notes"""
+    def get_planner_notes(self) -> Optional[List[Dict[str, Any]]]:
+        """Fetch user's planner notes, or None if the request failed"""
         try:
-            response = requests.get(
+            return list(self._get_all(
                 f'{self.base_url}/api/v1/planner_notes',
-                headers=self.headers,
-                params={'per_page': 50},
-                timeout=10
-            )
-            if response.status_code == 200:
-                return response.json()
-            return []
+                {'per_page': 100}
+            ))
         except Exception as e:
             print(f"Failed to fetch planner notes: {e}")
-            return []
+            return None
     
-    def get_calendar_events(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
-        """Fetch user's calendar events between two dates"""
+    def get_calendar_events(self, start_date: datetime, end_date: datetime,
+                            context_codes: Optional[List[str]] = None) -> Optional[List[Dict[str, Any]]]:
+        """Fetch calendar events between two dates, optionally for specific contexts
+        
+        Returns None if the request failed, and an empty list for contexts
+        the user has no access to.
+        """
         params = {
             'type': 'event',
             'start_date': start_date.date().isoformat(),
             'end_date': end_date.date().isoformat(),
-            'per_page': 50,
+            'per_page': 100,
         }
+        if context_codes:
+            # e.g. ['course_123', 'user_self']; sent as repeated context_codes[]
+            params['context_codes[]'] = context_codes
         try:
-            response = requests.get(
+            return list(self._get_all(
                 f'{self.base_url}/api/v1/calendar_events',
-                headers=self.headers,
-                params=params,
-                timeout=10,
-            )
-            if response.status_code == 200:
-                return response.json()
-            return []
+                params
+            ))
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code in NO_ACCESS_STATUSES:
+                # Restricted context or hidden calendar: nothing to show
+                return []
+            print(f"Failed to fetch calendar events: {e}")
+            return None
         except Exception as e:
             print(f"Failed to fetch calendar events: {e}")
-            return []
+            return None
     
     def create_planner_note(self, title: str, details: str, 
                            todo_date: str, course_id: Optional[int] = None) -> Dict[str, Any]:
@@ -158,14 +291,13 @@ class CanvasAPI:
             payload['course_id'] = course_id
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}/api/v1/planner_notes',
-                headers=self.headers,
-                json=payload,
-                timeout=10
+                data=orjson.dumps(payload),
+                timeout=REQUEST_TIMEOUT
             )
             if response.status_code in [200, 201]:
-                return {'success': True, 'data': response.json(), 'method': 'planner_note'}
+                return {'success': True, 'data': orjson.loads(response.content), 'method': 'planner_note'}
             return {'success': False, 'error': response.text}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -173,8 +305,7 @@ class CanvasAPI:
     def create_calendar_event(self, title: str, description: str,
                              start_at: str, course_id: Optional[int] = None) -> Dict[str, Any]:
         """Create a calendar event (fallback method)"""
-        end_at = (datetime.fromisoformat(start_at.replace('Z', '+00:00')) + 
-                  timedelta(hours=1)).isoformat()
+        end_at = (_parse_canvas_dt(start_at) + timedelta(hours=1)).isoformat()
         
         payload = {
             'calendar_event': {
@@ -190,14 +321,13 @@ class CanvasAPI:
             payload['calendar_event']['context_code'] = f'course_{course_id}'
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}/api/v1/calendar_events',
-                headers=self.headers,
-                json=payload,
-                timeout=10
+                data=orjson.dumps(payload),
+                timeout=REQUEST_TIMEOUT
             )
             if response.status_code in [200, 201]:
-                return {'success': True, 'data': response.json(), 'method': 'calendar_event'}
+                return {'success': True, 'data': orjson.loads(response.content), 'method': 'calendar_event'}
             return {'success': False, 'error': response.text}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -230,6 +360,7 @@ class Config:
     def __init__(self):
         self.config_dir = Path.home() / '.config' / 'canvas-tui'
         self.config_file = self.config_dir / 'config.json'
+        self.cache_path = self.config_dir / 'cache.sqlite'
         self.config = self.load_config()
     
     def load_config(self) -> Dict[str, str]:
@@ -255,6 +386,107 @@ class Config:
                    self.config.get('canvas_token'))
 
 
+# ============================================================================
+# Local Task Cache
+# ============================================================================
+
+class TaskCache:
+    """Persist fetched tasks in SQLite so startup can render instantly"""
+    
+    def __init__(self, path: Path, account: str):
+        self.path = path
+        # Identifies the Canvas instance + token the cached rows belong to
+        self.account = account
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database, creating the schema if needed"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS tasks ('
+            'id TEXT PRIMARY KEY, type TEXT, due_date TEXT, payload BLOB)'
+        )
+        conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        return conn
+    
+    def _stored_account(self, conn: sqlite3.Connection) -> Optional[str]:
+        """Return the account the cached rows were saved for"""
+        row = conn.execute("SELECT value FROM meta WHERE key = 'account'").fetchone()
+        return row[0] if row else None
+    
+    def load(self, since: datetime) -> List[Task]:
+        """Load cached tasks due on or after `since`, sorted by due date
+        
+        Rows saved for a different account count as a cache miss; rows
+        that no longer decode into a Task are dropped.
+        """
+        tasks = []
+        try:
+            conn = self._connect()
+            try:
+                if self._stored_account(conn) != self.account:
+                    return []
+                rows = conn.execute(
+                    'SELECT id, due_date, payload FROM tasks WHERE due_date >= ? ORDER BY due_date',
+                    (since.isoformat(),)
+                ).fetchall()
+                
+                bad_ids = []
+                for task_id, due_date, payload in rows:
+                    try:
+                        fields = orjson.loads(payload)
+                        fields['due_date'] = datetime.fromisoformat(due_date)
+                        tasks.append(Task(**fields))
+                    except (orjson.JSONDecodeError, TypeError, ValueError):
+                        bad_ids.append((task_id,))
+                if bad_ids:
+                    with conn:
+                        conn.executemany('DELETE FROM tasks WHERE id = ?', bad_ids)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"Failed to load task cache: {e}")
+            return []
+        return tasks
+    
+    def save(self, tasks: List[Task]):
+        """Upsert current tasks and drop stale ones in a single transaction"""
+        rows = [
+            (
+                _task_key(task),
+                task.type,
+                task.due_date.isoformat(),
+                orjson.dumps(task),
+            )
+            for task in tasks
+        ]
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    # Never mix rows from different accounts
+                    if self._stored_account(conn) != self.account:
+                        conn.execute('DELETE FROM tasks')
+                        conn.execute(
+                            "INSERT OR REPLACE INTO meta (key, value) VALUES ('account', ?)",
+                            (self.account,)
+                        )
+                    conn.executemany(
+                        'INSERT INTO tasks (id, type, due_date, payload) VALUES (?, ?, ?, ?) '
+                        'ON CONFLICT(id) DO UPDATE SET type = excluded.type, '
+                        'due_date = excluded.due_date, payload = excluded.payload',
+                        rows
+                    )
+                    conn.execute(
+                        'DELETE FROM tasks WHERE id NOT IN (SELECT value FROM json_each(?))',
+                        (json.dumps([row[0] for row in rows]),)
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"Failed to save task cache: {e}")
+
+
 # ============================================================================
 # Add Task Modal Screen
 # ============================================================================
@@ -402,9 +634,14 @@ class CanvasTUI(App):
     def __init__(self):
         super().__init__()
         self.config = Config()
+        self.cache = None
         self.canvas = None
         self.courses = []
         self.tasks = []
+        # Row key -> rendered cells / task, for incremental table updates
+        self._rendered: Dict[str, tuple] = {}
+        self._task_by_key: Dict[str, Task] = {}
+        self._column_keys = []
     
     def compose(self) -> ComposeResult:
         yield Header()
@@ -429,210 +666,309 @@ class CanvasTUI(App):
             self.config.get('canvas_base_url'),
             self.config.get('canvas_token')
         )
-        
-        # Validate token
-        if not self.canvas.validate_token():
-            self.notify("Invalid Canvas token", severity="error")
-            return
+        self.cache = TaskCache(
+            self.config.cache_path,
+            _cache_account(self.config.get('canvas_base_url'), self.config.get('canvas_token'))
+        )
         
         # Setup table
         table = self.query_one("#tasks_table", DataTable)
-        table.add_columns("Due", "Status", "Course", "Title", "Type")
+        self._column_keys = table.add_columns("Due", "Status", "Course", "Title", "Type")
         table.cursor_type = "row"
         
-        # Load initial data
+        # Show cached tasks immediately, then refresh from Canvas
+        cached = self.cache.load(datetime.now(MANILA).replace(tzinfo=None))
+        if cached:
+            self._render_tasks(cached)
         self.refresh_tasks()
     
+    # Own group so a refresh only supersedes earlier refreshes, not task creation
+    @work(exclusive=True, thread=True, group="refresh")
     def refresh_tasks(self):
-        """Fetch and display tasks from Canvas"""
-        self.query_one("#status_bar", Static).update("Fetching tasks from Canvas...")
+        """Fetch tasks from Canvas in a background worker and display them"""
+        worker = get_current_worker()
+        self.call_from_thread(self._set_status, "Fetching tasks from Canvas...")
+        # Validate token on first use
+        if self.canvas.user_id is None:
+            try:
+                valid = self.canvas.validate_token()
+            except requests.RequestException as e:
+                print(f"Token validation failed: {e}")
+                # Keep whatever (cached) tasks are already shown
+                self.call_from_thread(
+                    self._set_status,
+                    f"⚠ Offline: {len(self.tasks)} cached tasks | Press 'r' to retry, 'q' to quit"
+                )
+                self.call_from_thread(
+                    self.notify, "Can't reach Canvas; showing cached tasks", severity="warning"
+                )
+                return
+            if not valid:
+                self.call_from_thread(
+                    self._set_status, "Invalid Canvas token | Check ~/.config/canvas-tui/config.json"
+                )
+                self.call_from_thread(self.notify, "Invalid Canvas token", severity="error")
+                return
         
-        # Fetch courses
-        self.courses = self.canvas.get_active_courses()
-
+        # Failed sources keep the tasks currently shown, so the table and the
+        # cache stay in agreement
+        courses, tasks, complete = self._fetch_all(self.tasks)
+        # A newer refresh superseded this one; its results win
+        if worker.is_cancelled:
+            return
+        self.cache.save(tasks)
+        self.call_from_thread(self._finish_refresh, worker, courses, tasks, complete)
+    
+    def _finish_refresh(self, worker: Worker, courses: Optional[List[Dict[str, Any]]],
+                        tasks: List[Task], complete: bool):
+        """Apply results of a refresh worker (runs on the UI thread)"""
+        # Cancellation happens on this thread, so this check can't race
+        if worker.is_cancelled:
+            return
+        if courses is not None:
+            self.courses = courses
+        self._render_tasks(tasks)
+        if not complete:
+            self.notify("Some Canvas requests failed; showing last known tasks for them",
+                        severity="warning")
+    
+    def _set_status(self, text: str):
+        """Update the status bar"""
+        self.query_one("#status_bar", Static).update(text)
+    
+    def _fetch_all(self, previous: List[Task]) -> Tuple[Optional[List[Dict[str, Any]]], List[Task], bool]:
+        """Fetch and normalize courses and tasks from Canvas (runs off the UI thread)
+        
+        Tasks from `previous` are carried over for any source whose request
+        failed. Returns the courses (None if that request failed), the
+        tasks, and whether every Canvas request succeeded.
+        """
         # Normalize and filter tasks
-        self.tasks = []
-        now = datetime.now()
-        cutoff = now - timedelta(days=30)
-        future = now + timedelta(days=30)
-        # Current time in Manila (naive)
-        now_manila = datetime.now(ZoneInfo('Asia/Manila')).replace(tzinfo=None)
+        tasks = []
+        # Window is [now, now + 30 days]; bounds as POSIX timestamps, computed once
+        now_utc = datetime.now(timezone.utc)
+        future_utc = now_utc + timedelta(days=30)
+        now_ts = now_utc.timestamp()
+        future_ts = future_utc.timestamp()
         
-        # Fetch planner notes
-        planner_notes = self.canvas.get_planner_notes()
-
-        # Fetch calendar events in same window
-        calendar_events = self.canvas.get_calendar_events(cutoff, future)
+        # Fetch planner notes, calendar events (same window) and assignments
+        # from all courses concurrently; the session pool is shared by threads.
+        # Notes and personal events don't depend on the course list, so they
+        # are already in flight while courses are fetched.
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            notes_future = ex.submit(self.canvas.get_planner_notes)
+            event_futures = [
+                ('user_self', ex.submit(self.canvas.get_calendar_events, now_utc, future_utc, ['user_self']))
+            ]
+            courses = self.canvas.get_active_courses()
+            # One events request per course keeps each server-side scan small
+            event_futures.extend(
+                (f"course_{c['id']}",
+                 ex.submit(self.canvas.get_calendar_events, now_utc, future_utc, [f"course_{c['id']}"]))
+                for c in courses or []
+            )
+            results = list(ex.map(
+                lambda c: (c, self.canvas.get_assignments(c['id'])),
+                courses or []
+            ))
+            planner_notes = notes_future.result()
+            event_pages = [(f"events:{code}", f.result()) for code, f in event_futures]
+        # Forget pages this refresh no longer asks for (e.g. yesterday's window)
+        self.canvas.prune_etag_cache()
+        
+        # Failed requests come back as None; note which sources they were
+        failed = {source for source, page in event_pages if page is None}
+        failed.update(
+            f"assignments:{course['id']}" for course, assignments in results if assignments is None
+        )
+        if planner_notes is None:
+            failed.add('planner_notes')
+        complete = courses is not None and not failed
+        
+        # Without the course list, every per-course source counts as failed
+        def source_failed(source: str) -> bool:
+            return source in failed or (
+                courses is None and source.startswith(('assignments:', 'events:course_'))
+            )
+        
+        now_manila = now_utc.astimezone(MANILA).replace(tzinfo=None)
+        tasks.extend(
+            task for task in previous
+            if source_failed(task.source) and task.due_date >= now_manila
+        )
+        
+        planner_notes = planner_notes or []
+        calendar_events = [
+            (source, event) for source, page in event_pages if page for event in page
+        ]
         
-        # Fetch assignments from all courses
         all_assignments = []
-        for course in self.courses:
-            assignments = self.canvas.get_assignments(course['id'])
+        for course, assignments in results:
+            if not assignments:
+                continue
+            source = f"assignments:{course['id']}"
             for assignment in assignments:
                 assignment['course_name'] = course['name']
-            all_assignments.extend(assignments)
+                all_assignments.append((source, assignment))
         
         # Add planner notes (only active and future)
         for note in planner_notes:
             # Skip resolved / inactive notes
             if note.get('workflow_state') not in (None, 'active'):
                 continue
+            if not note.get('todo_date'):
+                continue
 
-            if note.get('todo_date'):
-                try:
-                    # Build URL for planner note if possible
-                    note_url = None
-                    if note.get('course_id'):
-                        note_url = f"{self.canvas.base_url}/courses/{note['course_id']}/planner_items?filter=planner_note_{note['id']}"
-                    due = date_parser.isoparse(note['todo_date'])
-                    # Convert to Manila time
-                    if due.tzinfo is not None:
-                        due = due.astimezone(ZoneInfo('Asia/Manila'))
-                    else:
-                        due = due.replace(tzinfo=timezone.utc).astimezone(ZoneInfo('Asia/Manila'))
-                    # Make naive for comparison and storage
-                    due_naive = due.replace(tzinfo=None)
-                    cutoff_manila = (
-                        cutoff.replace(tzinfo=timezone.utc)
-                        .astimezone(ZoneInfo("Asia/Manila"))
-                        .replace(tzinfo=None)
-                    )
-                    future_manila = (
-                        future.replace(tzinfo=timezone.utc)
-                        .astimezone(ZoneInfo("Asia/Manila"))
-                        .replace(tzinfo=None)
-                    )
+            # Filter out past tasks: require now <= due <= future
+            due_naive = _to_manila_naive_if_in_window(note['todo_date'], now_ts, future_ts)
+            if due_naive is None:
+                continue
+
+            # Build URL for planner note if possible
+            note_url = None
+            if note.get('course_id'):
+                note_url = f"{self.canvas.base_url}/courses/{note['course_id']}/planner_items?filter=planner_note_{note.get('id')}"
 
-                    # Filter out past tasks: require due >= now (Manila)
-                    if now_manila <= due_naive <= future_manila:
-                        self.tasks.append({
-                            'title': note['title'],
-                            'due_date': due_naive,
-'course': note.get('course_id', 'Personal'),
-                            'type': 'Planner Note',
-                            'url': note_url,
-                            'raw': note,
-                        })
-                except Exception:
-                    pass
+            tasks.append(Task(
+                title=note.get('title', 'Untitled Note'),
+                due_date=due_naive,
+                course=str(note['course_id']) if note.get('course_id') else 'Personal',
+                type='Planner Note',
+                url=note_url,
+                raw=note,
+                source='planner_notes',
+            ))
         
         # Add calendar events
-        for event in calendar_events:
-            try:
-                event_url = event.get('html_url')
-                if event.get('start_at'):
-                    due = date_parser.isoparse(event['start_at'])
-                elif event.get('all_day_date'):
-                    # all-day events use a date string
-                    due = date_parser.isoparse(event['all_day_date'])
-                else:
-                    continue
+        for source, event in calendar_events:
+            event_url = event.get('html_url')
+            if event.get('start_at'):
+                when = event['start_at']
+            elif event.get('all_day_date'):
+                # all-day events use a date string
+                when = event['all_day_date']
+            else:
+                continue
+
+            # Filter out past events
+            due_naive = _to_manila_naive_if_in_window(when, now_ts, future_ts)
+            if due_naive is None:
+                continue
 
-                # Convert to Manila time
-                if due.tzinfo is not None:
-                    due = due.astimezone(ZoneInfo('Asia/Manila'))
-                else:
-                    due = due.replace(tzinfo=timezone.utc).astimezone(ZoneInfo('Asia/Manila'))
-                # Make naive for comparison and storage
-                due_naive = due.replace(tzinfo=None)
-                cutoff_manila = cutoff.replace(tzinfo=timezone.utc).astimezone(ZoneInfo('Asia/Manila')).replace(tzinfo=None)
-                future_manila = future.replace(tzinfo=timezone.utc).astimezone(ZoneInfo('Asia/Manila')).replace(tzinfo=None)
-
-                # Filter out past events
-                if now_manila <= due_naive <= future_manila:
-                    # Prefer context name if available, else use context code or "Calendar"
-                    context = event.get('context_name') or event.get('context_code', 'Calendar')
-                    self.tasks.append({
-                        'title': event.get('title', 'Untitled Event'),
-                        'due_date': due_naive,
-'course': context,
-                        'type': 'Calendar Event',
-                        'url': event_url,
-                        'raw': event,
-                    })
-            except Exception:
-                pass
-
-            # Add assignments (skip submitted / graded, only future)
-        for assignment in all_assignments:
+            # Prefer context name if available, else use context code or "Calendar"
+            context = event.get('context_name') or event.get('context_code', 'Calendar')
+            tasks.append(Task(
+                title=event.get('title', 'Untitled Event'),
+                due_date=due_naive,
+                course=context,
+                type='Calendar Event',
+                url=event_url,
+                raw=event,
+                source=source,
+            ))
+
+        # Add assignments (skip submitted / graded, only future)
+        for source, assignment in all_assignments:
             # Skip completed assignments
             submission = assignment.get("submission") or {}
             if assignment.get("has_submitted_submissions") or submission.get(
                 "workflow_state"
             ) in {"submitted", "graded", "complete"}:
                 continue
+            if not assignment.get("due_at"):
+                continue
 
-            if assignment.get("due_at"):
-                try:
-                    # Assignment URL
-                    assignment_url = (
-                        f"{self.canvas.base_url}/courses/{assignment['course_id']}"
-                        f"/assignments/{assignment['id']}"
-                        if assignment.get("course_id") and assignment.get("id")
-                        else None
-                    )
-                    due = date_parser.isoparse(assignment["due_at"])
-                    # Convert to Manila time
-                    if due.tzinfo is not None:
-                        due = due.astimezone(ZoneInfo("Asia/Manila"))
-                    else:
-                        due = due.replace(tzinfo=timezone.utc).astimezone(
-                            ZoneInfo("Asia/Manila")
-                        )
-                    # Make naive for comparison and storage
-                    due_naive = due.replace(tzinfo=None)
-                    cutoff_manila = (
-                        cutoff.replace(tzinfo=timezone.utc)
-                        .astimezone(ZoneInfo("Asia/Manila"))
-                        .replace(tzinfo=None)
-                    )
-                    future_manila = (
-                        future.replace(tzinfo=timezone.utc)
-                        .astimezone(ZoneInfo("Asia/Manila"))
-                        .replace(tzinfo=None)
-                    )
+            # Only future (or today) assignments
+            due_naive = _to_manila_naive_if_in_window(assignment["due_at"], now_ts, future_ts)
+            if due_naive is None:
+                continue
 
-                    # Only future (or today) assignments
-                    if now_manila <= due_naive <= future_manila:
-                        self.tasks.append(
-                            {
-                                "title": assignment["name"],
-                                "due_date": due_naive,
-                                "course": assignment.get("course_name", "Unknown"),
-                                "type": "Assignment",
-                                "url": assignment_url,
-                                "raw": assignment,
-                            }
-                        )
-                except Exception:
-                    pass
+            # Assignment URL
+            assignment_url = (
+                f"{self.canvas.base_url}/courses/{assignment['course_id']}"
+                f"/assignments/{assignment['id']}"
+                if assignment.get("course_id") and assignment.get("id")
+                else None
+            )
+
+            tasks.append(
+                Task(
+                    title=assignment.get("name", "Untitled Assignment"),
+                    due_date=due_naive,
+                    course=assignment.get("course_name", "Unknown"),
+                    type="Assignment",
+                    url=assignment_url,
+                    raw=assignment,
+                    source=source,
+                )
+            )
         
         # Sort by due date
-        self.tasks.sort(key=lambda x: x['due_date'])
-        
-        # Update table
-        table = self.query_one("#tasks_table", DataTable)
-        table.clear()
+        tasks.sort(key=attrgetter('due_date'))
+        return courses, tasks, complete
+    
+    def _render_tasks(self, tasks: List[Task]):
+        """Display normalized tasks in the table"""
+        self.tasks = tasks
+        # Bounds of today in Manila (naive), computed once
+        today = datetime.now(MANILA).date()
+        today_start = datetime(today.year, today.month, today.day)
+        tomorrow = today_start + timedelta(days=1)
         
-        for idx, task in enumerate(self.tasks):
-            due_str = task["due_date"].strftime("%m/%d %H:%M")
+        rows = {}
+        task_by_key = {}
+        for task in self.tasks:
+            due = task.due_date
+            # Same as strftime("%m/%d %H:%M") without the format parsing
+            due_str = f"{due.month:02d}/{due.day:02d} {due.hour:02d}:{due.minute:02d}"
             # Simple status indicator based on Manila date
-            if task["due_date"].date() == now_manila.date():
+            if today_start <= due < tomorrow:
                 status = "Today"
             else:
                 status = "Upcoming"
 
-            course_str = str(task["course"])[:20]
-            title_str = task["title"][:50]
+            course_str = str(task.course)[:20]
+            title_str = task.title[:50]
             
-            # Store the index as the row key so we can map back to tasks
-            table.add_row(due_str, status, course_str, title_str, task["type"], key=idx)
+            key = _task_key(task)
+            rows[key] = (due_str, status, course_str, title_str, task.type)
+            task_by_key[key] = task
+        
+        # Update table with a minimal diff against what is already shown
+        table = self.query_one("#tasks_table", DataTable)
+        kept = [key for key in self._rendered if key in rows]
+        added = [key for key in rows if key not in self._rendered]
+        if kept + added == list(rows):
+            for key in self._rendered:
+                if key not in rows:
+                    table.remove_row(key)
+            for key in kept:
+                old_row, new_row = self._rendered[key], rows[key]
+                if old_row == new_row:
+                    continue
+                for column_key, old_cell, new_cell in zip(self._column_keys, old_row, new_row):
+                    if old_cell != new_cell:
+                        # Widen the column like a full rebuild would
+                        table.update_cell(key, column_key, new_cell, update_width=True)
+        else:
+            # Rows were reordered; appending would break due date order
+            table.clear()
+            added = list(rows)
+        for key in added:
+            table.add_row(*rows[key], key=key)
+        self._rendered = rows
+        self._task_by_key = task_by_key
         
-        self.query_one("#status_bar", Static).update(
+        self._set_status(
             f"📚 {len(self.tasks)} tasks loaded | Press 'a' to add, 'r' to refresh, 'q' to quit"
         )
         self.notify(f"Loaded {len(self.tasks)} tasks")
     
+    def on_unmount(self):
+        """Release Canvas connections on exit"""
+        if self.canvas:
+            self.canvas.close()
+
     def action_refresh(self):
         """Refresh tasks from Canvas"""
         self.refresh_tasks()
@@ -652,22 +988,18 @@ class CanvasTUI(App):
     def action_open_task(self):
         """Open the selected task in the browser, if it has a URL"""
         table = self.query_one("#tasks_table", DataTable)
-        if table.cursor_row is None:
+        try:
+            row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
+        except CellDoesNotExist:
             self.notify("No task selected", severity="warning")
             return
 
-        row_key = table.row_key(table.cursor_row)
-        if row_key is None:
-            self.notify("Unable to determine selected task", severity="error")
-            return
-
-        try:
-            task = self.tasks[row_key]
-        except (IndexError, TypeError):
+        task = self._task_by_key.get(row_key.value)
+        if task is None:
             self.notify("Selected task not found", severity="error")
             return
 
-        url = task.get('url')
+        url = task.url
         if not url:
             self.notify("No URL available for this task", severity="warning")
             return
@@ -678,9 +1010,10 @@ class CanvasTUI(App):
         except Exception as e:
             self.notify(f"Failed to open browser: {e}", severity="error")
     
+    @work(thread=True)
     def create_canvas_task(self, task_data: Dict[str, Any]):
-        """Create task in Canvas using API"""
-        self.notify("Creating task in Canvas...")
+        """Create task in Canvas using API in a background worker"""
+        self.call_from_thread(self.notify, "Creating task in Canvas...")
         
         result = self.canvas.create_task(
             title=task_data['title'],
@@ -691,11 +1024,14 @@ class CanvasTUI(App):
         
         if result['success']:
             method = result['method'].replace('_', ' ').title()
-            self.notify(f"Task created as {method}!", severity="information")
-            self.refresh_tasks()
+            self.call_from_thread(self.notify, f"Task created as {method}!", severity="information")
+            self.call_from_thread(self.refresh_tasks)
         else:
-            self.notify(f"Failed to create task: {result.get('error', 'Unknown error')}", 
-                       severity="error")
+            self.call_from_thread(
+                self.notify,
+                f"Failed to create task: {result.get('error', 'Unknown error')}",
+                severity="error"
+            )
 
 
 # ============================================================================